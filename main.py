@@ -3,16 +3,24 @@ Job Search Dashboard - Backend API
 FastAPI server for scraping jobs and managing application status
 """
 
+import asyncio
 import sqlite3
 import csv
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
+from functools import lru_cache
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+import aiosqlite
+import orjson
 import pandas as pd
 
 # Try to import jobspy - will fail gracefully if not installed
@@ -23,7 +31,34 @@ except ImportError:
     JOBSPY_AVAILABLE = False
     print("⚠️  jobspy not installed. Run: pip install python-jobspy")
 
-app = FastAPI(title="Job Search Dashboard API")
+# pyahocorasick is optional - keyword filtering falls back to a compiled regex
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib json module"""
+    def render(self, content) -> bytes:
+        # by_site/by_status can have a NULL key
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+@asynccontextmanager
+async def lifespan(app):
+    """Give each run a fresh reader pool and close the shared connections on shutdown"""
+    reset_reader_pool()
+    yield
+    while not _reader_pool.empty():
+        await _reader_pool.get_nowait().close()
+    reset_reader_pool()
+    close_writer()
+
+app = FastAPI(
+    title="Job Search Dashboard API",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan,
+)
 
 # CORS for frontend
 app.add_middleware(
@@ -37,17 +72,105 @@ app.add_middleware(
 # Database setup
 DB_PATH = Path(__file__).parent / "jobs.db"
 
+# Per-connection settings (journal_mode=WAL is persistent and set in init_db)
+CONNECTION_PRAGMAS = [
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -131072",
+    # Map the file so hot pages are read without a copy into the page cache
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+]
+
+# INTEGER columns the frontend expects as booleans
+BOOLEAN_COLUMNS = ('checked', 'is_remote')
+
+def dict_factory(cursor, row):
+    """Build each row as a dict, with the boolean flag columns already cast"""
+    record = dict(zip([column[0] for column in cursor.description], row))
+    for column in BOOLEAN_COLUMNS:
+        if column in record:
+            record[column] = bool(record[column])
+    return record
+
+# One long-lived connection does all the writing; the lock serializes its
+# users across the threadpool routes
+_writer = None
+_writer_lock = threading.RLock()
+
+# Read-only routes borrow from a small pool of aiosqlite connections, opened
+# on demand up to READER_POOL_SIZE
+READER_POOL_SIZE = 4
+_reader_pool = asyncio.Queue()
+_readers_opened = 0
+
+def reset_reader_pool():
+    """Start an empty pool; the queue is recreated so it binds to the running loop"""
+    global _reader_pool, _readers_opened
+    _reader_pool = asyncio.Queue()
+    _readers_opened = 0
+
+def open_connection():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.row_factory = dict_factory
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def close_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+            _writer = None
+
 @contextmanager
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Shared writer connection, held exclusively for the block"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = open_connection()
+        try:
+            yield _writer
+        except BaseException:
+            # Don't leave a half-done transaction for the next caller
+            _writer.rollback()
+            raise
+
+async def open_reader():
+    conn = await aiosqlite.connect(DB_PATH)
+    conn.row_factory = dict_factory
+    for pragma in CONNECTION_PRAGMAS:
+        await conn.execute(pragma)
+    return conn
+
+@asynccontextmanager
+async def get_async_db():
+    """Pooled connection for read-only routes that runs queries off the event loop"""
+    global _readers_opened
+    if _reader_pool.empty() and _readers_opened < READER_POOL_SIZE:
+        # Claim the slot before awaiting so concurrent requests can't overshoot
+        _readers_opened += 1
+        try:
+            conn = await open_reader()
+        except BaseException:
+            _readers_opened -= 1
+            raise
+    else:
+        conn = await _reader_pool.get()
     try:
         yield conn
     finally:
-        conn.close()
+        _reader_pool.put_nowait(conn)
 
 def init_db():
     with get_db() as conn:
+        # Only takes effect on a new database (before any table exists and
+        # before switching to WAL)
+        conn.execute("PRAGMA page_size = 8192")
+        # WAL lets readers proceed while a scrape/update is writing
+        conn.execute("PRAGMA journal_mode = WAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS jobs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -74,10 +197,158 @@ def init_db():
             conn.execute("ALTER TABLE jobs ADD COLUMN applied_at TEXT")
         except:
             pass  # Column already exists
+        # Indexes for the /api/jobs filter + sort and the /api/stats group-bys
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_status_date
+            ON jobs(status, date_posted DESC, created_at DESC)
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_checked ON jobs(checked)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_site ON jobs(site)")
+        # Full-text index over the searchable columns, kept in sync by triggers.
+        # The trigram tokenizer matches substrings like the LIKE search did.
+        fts_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+        ).fetchone()
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, location,
+                content='jobs', content_rowid='id', tokenize='trigram'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_insert AFTER INSERT ON jobs
+            BEGIN
+                INSERT INTO jobs_fts(rowid, title, company, location)
+                VALUES (NEW.id, NEW.title, NEW.company, NEW.location);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_delete AFTER DELETE ON jobs
+            BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+                VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.location);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_update
+            AFTER UPDATE OF title, company, location ON jobs
+            BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+                VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.location);
+                INSERT INTO jobs_fts(rowid, title, company, location)
+                VALUES (NEW.id, NEW.title, NEW.company, NEW.location);
+            END
+        """)
+        if not fts_exists:
+            # Index the jobs that were stored before the FTS table existed
+            conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+        # Stamp applied_at when a job moves to 'applied', clear it otherwise
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_applied_at
+            AFTER UPDATE OF status ON jobs
+            BEGIN
+                UPDATE jobs
+                SET applied_at = CASE WHEN NEW.status = 'applied' THEN date('now', 'localtime') END
+                WHERE id = NEW.id AND (NEW.status = 'applied' OR OLD.applied_at IS NOT NULL);
+            END
+        """)
         conn.commit()
+        # Refresh planner statistics so the new indexes get used
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
 
 init_db()
 
+# Non-ISO date formats seen in CSV exports, tried in order after fromisoformat
+CSV_DATE_FORMATS = (
+    '%m/%d/%Y',
+    '%b %d %Y',
+    '%b %d, %Y',
+    '%B %d %Y',
+    '%B %d, %Y',
+)
+
+def parse_date(value):
+    """Normalize an imported date string to YYYY-MM-DD, or None when unparseable"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        # Covers dates, 'T'/space-separated times, fractional seconds and offsets
+        return datetime.fromisoformat(value).strftime('%Y-%m-%d')
+    except ValueError:
+        pass
+    for date_format in CSV_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return None
+
+def parse_amount(value):
+    """Salary amount from a CSV cell, or None when empty/invalid"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=32)
+def keyword_matcher(keywords):
+    """Predicate for lowercase titles containing any of the literal keywords"""
+    if AHOCORASICK_AVAILABLE:
+        # One linear scan per title no matter how many keywords there are
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda title: next(automaton.iter(title), None) is not None
+    
+    # Escaped so the keywords stay literals; compiled once instead of per title
+    pattern = re.compile('|'.join(map(re.escape, keywords)))
+    return lambda title: pattern.search(title) is not None
+
+def is_missing(value):
+    """True for None and the NaN/NaT/NA placeholders in jobspy records"""
+    return pd.isna(value)
+
+def scraped_date(value):
+    """Scraped date as YYYY-MM-DD, or None when missing/unparseable"""
+    if is_missing(value):
+        return None
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    try:
+        return datetime.fromisoformat(str(value)).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+def scraped_amount(value):
+    """Scraped salary amount as a float, or None when missing/invalid"""
+    if is_missing(value):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def scraped_value(value):
+    """Scraped text cell, with NaN placeholders turned into None"""
+    return None if is_missing(value) else value
+
+def scraped_flag(value):
+    """1 for a true is_remote cell, 0 for false or missing"""
+    return 0 if is_missing(value) else int(bool(value))
+
+# The dashboard polls /api/stats; serve it from a short-lived cache that
+# every write invalidates. The generation lets a query that overlapped a
+# write skip caching its pre-write counts.
+STATS_TTL_SECONDS = 5
+_stats_cache = {"expires": 0.0, "stats": None, "generation": 0}
+
+def invalidate_stats():
+    _stats_cache["generation"] += 1
+    _stats_cache["expires"] = 0.0
+
 # Pydantic models
 class JobUpdate(BaseModel):
     checked: Optional[bool] = None
@@ -91,85 +362,217 @@ class ScrapeRequest(BaseModel):
     hours_old: Optional[int] = 72
     exclude_keywords: Optional[str] = None
 
+# Title keywords that mark a senior role when exclude_keywords isn't given
+DEFAULT_EXCLUDE_KEYWORDS = ('senior', 'sr.', 'sr', 'lead', 'principal', 'staff', 'manager', 'architect', 'head', 'director')
+
+# jobspy columns, in the order they are inserted into the jobs table
+SCRAPE_COLUMNS = [
+    'site', 'title', 'company', 'location', 'job_type', 'date_posted', 'job_url',
+    'min_amount', 'max_amount', 'salary_source', 'is_remote',
+]
+
+TITLE_INDEX = SCRAPE_COLUMNS.index('title')
+DATE_POSTED_INDEX = SCRAPE_COLUMNS.index('date_posted')
+
+# How each scraped column is coerced for sqlite3 (scraped_value otherwise)
+SCRAPE_CONVERTERS = {
+    'date_posted': scraped_date,
+    'min_amount': scraped_amount,
+    'max_amount': scraped_amount,
+    'is_remote': scraped_flag,
+}
+
+def scraped_job_row(record):
+    """Insert parameters (SCRAPE_COLUMNS order) for one jobspy record"""
+    return tuple(
+        SCRAPE_CONVERTERS.get(column, scraped_value)(record.get(column))
+        for column in SCRAPE_COLUMNS
+    )
+
+# jobs columns filled from a scrape (same order as SCRAPE_COLUMNS)
+JOB_INSERT_COLUMNS = (
+    "site, title, company, location, job_type, date_posted, job_url, "
+    "salary_min, salary_max, salary_source, is_remote"
+)
+
+# SQL reused on every scrape/import, built once so sqlite3's statement cache
+# always sees the same text
+INSERT_JOB_SQL = f"INSERT OR IGNORE INTO jobs ({JOB_INSERT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+CREATE_SCRAPE_STAGING_SQL = f"CREATE TEMP TABLE scraped_jobs AS SELECT {JOB_INSERT_COLUMNS} FROM jobs WHERE 0"
+INSERT_SCRAPE_STAGING_SQL = f"INSERT INTO scraped_jobs ({JOB_INSERT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+# Returns one row per job actually added (WHERE true keeps ON CONFLICT from
+# parsing as a join constraint)
+INSERT_FROM_SCRAPE_STAGING_SQL = (
+    f"INSERT INTO jobs ({JOB_INSERT_COLUMNS}) SELECT {JOB_INSERT_COLUMNS} FROM scraped_jobs WHERE true"
+    " ON CONFLICT(job_url) DO NOTHING RETURNING id"
+)
+
+# JobUpdate fields in bitmask order, with each one's SET clause and the
+# parameters it binds (applied_at is kept in step with status by a trigger)
+UPDATE_FIELDS = (
+    ('checked', "checked = ?", lambda update: (1 if update.checked else 0,)),
+    ('status', "status = ?", lambda update: (update.status,)),
+    ('notes', "notes = ?", lambda update: (update.notes,)),
+)
+
+def build_update_statement(mask):
+    """UPDATE statement and parameter builder for one combination of set fields"""
+    fields = [field for bit, field in enumerate(UPDATE_FIELDS) if mask & (1 << bit)]
+    sql = f"UPDATE jobs SET {', '.join(assignment for _, assignment, _ in fields)} WHERE id = ?"
+    builders = tuple(build for _, _, build in fields)
+    
+    def params(update, job_id):
+        return (*(param for build in builders for param in build(update)), job_id)
+    
+    return sql, params
+
+# Every non-empty combination of checked/status/notes, keyed by bitmask
+UPDATE_JOB_STATEMENTS = {
+    mask: build_update_statement(mask) for mask in range(1, 1 << len(UPDATE_FIELDS))
+}
+
+# Columns returned by /api/jobs (what the dashboard renders)
+JOB_LIST_COLUMNS = (
+    "id, site, title, company, location, job_type, date_posted, job_url, "
+    "salary_min, salary_max, is_remote, checked, status, notes, applied_at"
+)
+
 # API Routes
 @app.get("/api/jobs")
-def get_jobs(
+async def get_jobs(
     status: Optional[str] = None,
     checked: Optional[bool] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    include_total: bool = False
 ):
-    """Get all jobs with optional filters"""
-    with get_db() as conn:
-        query = "SELECT * FROM jobs WHERE 1=1"
+    """Get a page of jobs with optional filters.
+    
+    `total` is the number of jobs returned, or the number of matching jobs
+    across all pages when `include_total` is set.
+    """
+    async with get_async_db() as conn:
+        where = " WHERE 1=1"
         params = []
         
         if status and status != "all":
-            query += " AND status = ?"
+            where += " AND status = ?"
             params.append(status)
         
         if checked is not None:
-            query += " AND checked = ?"
+            where += " AND checked = ?"
             params.append(1 if checked else 0)
         
-        if search:
-            query += " AND (title LIKE ? OR company LIKE ? OR location LIKE ?)"
+        if search and len(search) >= 3 and not any(c in search for c in '%_'):
+            # Quoted as one phrase, so the trigram index does a substring match
+            where += " AND id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)"
+            params.append('"' + search.replace('"', '""') + '"')
+        elif search:
+            # Trigrams can't match fewer than 3 characters, and LIKE wildcards
+            # need LIKE
+            where += " AND (title LIKE ? OR company LIKE ? OR location LIKE ?)"
             search_pattern = f"%{search}%"
             params.extend([search_pattern, search_pattern, search_pattern])
         
-        query += " ORDER BY date_posted DESC, created_at DESC"
+        query = (
+            f"SELECT {JOB_LIST_COLUMNS} FROM jobs{where}"
+            " ORDER BY date_posted DESC, created_at DESC LIMIT ? OFFSET ?"
+        )
         
-        cursor = conn.execute(query, params)
-        jobs = [dict(row) for row in cursor.fetchall()]
+        cursor = await conn.execute(query, params + [limit, offset])
+        jobs = await cursor.fetchall()
         
-        # Convert checked to boolean for frontend
-        for job in jobs:
-            job['checked'] = bool(job['checked'])
-            job['is_remote'] = bool(job['is_remote'])
+        if include_total:
+            cursor = await conn.execute(f"SELECT COUNT(*) AS total FROM jobs{where}", params)
+            total = (await cursor.fetchone())['total']
+        else:
+            total = len(jobs)
         
-        return {"jobs": jobs, "total": len(jobs)}
+        # Rows are already JSON-ready, so skip FastAPI's jsonable_encoder pass
+        return OrjsonResponse({"jobs": jobs, "total": total})
 
 @app.patch("/api/jobs/{job_id}")
 def update_job(job_id: int, update: JobUpdate):
     """Update job status, checked state, or notes"""
+    mask = 0
+    for bit, (field, _, _) in enumerate(UPDATE_FIELDS):
+        if getattr(update, field) is not None:
+            mask |= 1 << bit
+    
+    if not mask:
+        raise HTTPException(status_code=400, detail="No updates provided")
+    
+    sql, params = UPDATE_JOB_STATEMENTS[mask]
+    
     with get_db() as conn:
-        updates = []
-        params = []
+        cursor = conn.execute(sql, params(update, job_id))
+        conn.commit()
+        invalidate_stats()
         
-        if update.checked is not None:
-            updates.append("checked = ?")
-            params.append(1 if update.checked else 0)
+        if cursor.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Job not found")
         
-        if update.status is not None:
-            updates.append("status = ?")
-            params.append(update.status)
-            # Set applied_at timestamp when status changes to 'applied'
-            if update.status == 'applied':
-                updates.append("applied_at = ?")
-                params.append(datetime.now().strftime('%Y-%m-%d'))
-            # Clear applied_at if status changes away from 'applied'
-            elif update.status != 'applied':
-                updates.append("applied_at = NULL")
+        return {"success": True}
+
+def save_scraped_jobs(jobs_df, request: ScrapeRequest):
+    """Filter scraped jobs and replace the 'new' jobs in the database with them"""
+    # Filter out senior roles using provided keywords or defaults
+    if request.exclude_keywords:
+        senior_keywords = [k.strip().lower() for k in request.exclude_keywords.split(',') if k.strip()]
+    else:
+        senior_keywords = DEFAULT_EXCLUDE_KEYWORDS
+    
+    matches = keyword_matcher(tuple(senior_keywords)) if senior_keywords else None
+    
+    # Work on plain records from here: one conversion instead of per-row Series
+    rows = [scraped_job_row(record) for record in jobs_df.to_dict(orient='records')]
+    if matches:
+        rows = [row for row in rows if not matches(str(row[TITLE_INDEX] or '').lower())]
+    
+    # Sort by date (newest first, undated last) and limit to requested amount
+    rows.sort(key=lambda row: row[DATE_POSTED_INDEX] or '', reverse=True)
+    rows = rows[:request.results_wanted]
+    
+    # Replace the 'new' jobs in one write transaction so the preserved URLs,
+    # the delete and the inserts all see the same snapshot
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
         
-        if update.notes is not None:
-            updates.append("notes = ?")
-            params.append(update.notes)
+        # Delete ALL jobs with status 'new' 
+        deleted = conn.execute("DELETE FROM jobs WHERE status = 'new'").rowcount
         
-        if not updates:
-            raise HTTPException(status_code=400, detail="No updates provided")
+        # Stage the scrape in a temp table with the same columns as jobs
+        conn.execute(CREATE_SCRAPE_STAGING_SQL)
+        conn.executemany(INSERT_SCRAPE_STAGING_SQL, rows)
         
-        params.append(job_id)
-        query = f"UPDATE jobs SET {', '.join(updates)} WHERE id = ?"
+        # Drop jobs that user already has with non-new status (already applied, etc.)
+        preserved = conn.execute("""
+            DELETE FROM scraped_jobs
+            WHERE job_url IN (SELECT job_url FROM jobs WHERE status != 'new')
+        """).rowcount
         
-        cursor = conn.execute(query, params)
+        added = len(conn.execute(INSERT_FROM_SCRAPE_STAGING_SQL).fetchall())
+        conn.execute("DROP TABLE scraped_jobs")
         conn.commit()
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Job not found")
-        
-        return {"success": True}
+        invalidate_stats()
+        # The delete + reinsert churn skews planner stats; this only
+        # re-analyzes tables that need it
+        conn.execute("PRAGMA optimize")
+    
+    total_found = len(rows) - preserved
+    skipped = total_found - added
+    
+    return {
+        "message": f"Scraping complete",
+        "added": added,
+        "skipped": skipped,
+        "deleted": deleted,
+        "total_found": total_found
+    }
 
 @app.post("/api/scrape")
-def scrape_new_jobs(request: ScrapeRequest):
+async def scrape_new_jobs(request: ScrapeRequest):
     """Run the job scraper and add new jobs to database"""
     if not JOBSPY_AVAILABLE:
         raise HTTPException(
@@ -187,7 +590,9 @@ def scrape_new_jobs(request: ScrapeRequest):
     target_sites = ["indeed", "linkedin", "zip_recruiter", "glassdoor"]
     
     try:
-        jobs_df = scrape_jobs(
+        # Scraping takes seconds - keep it off the event loop
+        jobs_df = await asyncio.to_thread(
+            scrape_jobs,
             site_name=target_sites,
             search_term=search_query,
             location=request.location,
@@ -201,83 +606,7 @@ def scrape_new_jobs(request: ScrapeRequest):
     if jobs_df.empty:
         return {"message": "No jobs found", "added": 0, "skipped": 0}
     
-    # Filter out senior roles using provided keywords or defaults
-    if request.exclude_keywords:
-        senior_keywords = [k.strip().lower() for k in request.exclude_keywords.split(',')]
-    else:
-        senior_keywords = ['senior', 'sr.', 'sr', 'lead', 'principal', 'staff', 'manager', 'architect', 'head', 'director']
-    
-    pattern = '|'.join(senior_keywords)
-    filtered_df = jobs_df[~jobs_df['title'].str.contains(pattern, case=False, na=False)].copy()
-    
-    # Sort by date (newest first) and limit to requested amount
-    if 'date_posted' in filtered_df.columns:
-        filtered_df['date_posted'] = pd.to_datetime(filtered_df['date_posted'], errors='coerce')
-        filtered_df = filtered_df.sort_values(by='date_posted', ascending=False)
-    
-    # Limit to requested number of results
-    filtered_df = filtered_df.head(request.results_wanted)
-    
-    # Get URLs of jobs user has interacted with (not 'new' status)
-    with get_db() as conn:
-        cursor = conn.execute("SELECT job_url FROM jobs WHERE status != 'new'")
-        preserved_urls = set(row[0] for row in cursor.fetchall())
-    
-    # Delete ALL jobs with status 'new' 
-    with get_db() as conn:
-        deleted = conn.execute("DELETE FROM jobs WHERE status = 'new'").rowcount
-        conn.commit()
-    
-    # Filter out jobs that user already has with non-new status (already applied, etc.)
-    filtered_df = filtered_df[~filtered_df['job_url'].isin(preserved_urls)]
-    
-    # Insert into database
-    added = 0
-    skipped = 0
-    
-    with get_db() as conn:
-        for _, row in filtered_df.iterrows():
-            try:
-                # Parse date
-                date_posted = None
-                if pd.notna(row.get('date_posted')):
-                    try:
-                        date_posted = pd.to_datetime(row['date_posted']).strftime('%Y-%m-%d')
-                    except:
-                        date_posted = str(row['date_posted'])
-                
-                conn.execute("""
-                    INSERT OR IGNORE INTO jobs 
-                    (site, title, company, location, job_type, date_posted, job_url, 
-                     salary_min, salary_max, salary_source, is_remote)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    row.get('site', ''),
-                    row.get('title', ''),
-                    row.get('company', ''),
-                    row.get('location', ''),
-                    row.get('job_type', ''),
-                    date_posted,
-                    row.get('job_url', ''),
-                    row.get('min_amount') if pd.notna(row.get('min_amount')) else None,
-                    row.get('max_amount') if pd.notna(row.get('max_amount')) else None,
-                    row.get('salary_source', ''),
-                    1 if row.get('is_remote') else 0
-                ))
-                added += 1
-                    
-            except sqlite3.IntegrityError:
-                skipped += 1
-        
-        conn.commit()
-    
-    return {
-        "message": f"Scraping complete",
-        "added": added,
-        "skipped": skipped,
-        "deleted": deleted,
-        "total_found": len(filtered_df)
-    }
+    return await asyncio.to_thread(save_scraped_jobs, jobs_df, request)
 
 @app.delete("/api/jobs/{job_id}")
 def delete_job(job_id: int):
@@ -285,78 +614,110 @@ def delete_job(job_id: int):
     with get_db() as conn:
         cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
         conn.commit()
+        invalidate_stats()
         
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="Job not found")
         
         return {"success": True}
 
-@app.get("/api/stats")
-def get_stats():
-    """Get job statistics"""
+# Rebuild the file once this share of its pages sits unused on the freelist
+VACUUM_FREELIST_FRACTION = 0.25
+
+@app.post("/api/maintenance")
+def run_maintenance():
+    """Compact the database and refresh planner stats if scrapes left it fragmented"""
     with get_db() as conn:
-        stats = {}
+        page_count = conn.execute("PRAGMA page_count").fetchone()['page_count']
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()['freelist_count']
+        freelist_fraction = freelist_count / page_count if page_count else 0.0
         
-        # Total jobs
-        stats['total'] = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        vacuumed = freelist_fraction > VACUUM_FREELIST_FRACTION
+        if vacuumed:
+            conn.execute("VACUUM")
+            conn.execute("ANALYZE")
         
-        # By status
-        cursor = conn.execute("SELECT status, COUNT(*) as count FROM jobs GROUP BY status")
-        stats['by_status'] = {row['status']: row['count'] for row in cursor.fetchall()}
-        
-        # Checked count
-        stats['checked'] = conn.execute("SELECT COUNT(*) FROM jobs WHERE checked = 1").fetchone()[0]
-        stats['unchecked'] = stats['total'] - stats['checked']
-        
-        # By site
-        cursor = conn.execute("SELECT site, COUNT(*) as count FROM jobs GROUP BY site")
-        stats['by_site'] = {row['site']: row['count'] for row in cursor.fetchall()}
-        
-        return stats
+        return {"vacuumed": vacuumed, "freelist_fraction": round(freelist_fraction, 3)}
+
+@app.get("/api/stats")
+async def get_stats():
+    """Get job statistics"""
+    if time.monotonic() < _stats_cache["expires"]:
+        return _stats_cache["stats"]
+    
+    generation = _stats_cache["generation"]
+    
+    # One grouped scan; the totals, status, checked and site views are summed from it
+    async with get_async_db() as conn:
+        cursor = await conn.execute("""
+            SELECT status, site, checked, COUNT(*) as count
+            FROM jobs GROUP BY status, site, checked
+        """)
+        groups = await cursor.fetchall()
+    
+    total = 0
+    checked = 0
+    by_status = {}
+    by_site = {}
+    for row in groups:
+        count = row['count']
+        total += count
+        if row['checked']:
+            checked += count
+        by_status[row['status']] = by_status.get(row['status'], 0) + count
+        by_site[row['site']] = by_site.get(row['site'], 0) + count
+    
+    stats = {
+        'total': total,
+        'by_status': by_status,
+        'checked': checked,
+        'unchecked': total - checked,
+        'by_site': by_site,
+    }
+    
+    if generation == _stats_cache["generation"]:
+        _stats_cache["stats"] = stats
+        _stats_cache["expires"] = time.monotonic() + STATS_TTL_SECONDS
+    return stats
+
+def import_csv_rows(csv_path):
+    """Insert the jobs from a CSV export, returning how many were added"""
+    # Empty CSV cells are stored as NULL, like the scraper's missing values
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        rows = [
+            (
+                row.get('site') or None,
+                row.get('title') or None,
+                row.get('company') or None,
+                row.get('location') or None,
+                row.get('job_type') or None,
+                parse_date(row.get('date_posted')),
+                row.get('job_url') or None,
+                parse_amount(row.get('min_amount')),
+                parse_amount(row.get('max_amount')),
+                None,  # salary_source isn't in the CSV export
+                1 if (row.get('is_remote') or '').lower() in ('true', '1', 'yes') else 0
+            )
+            for row in csv.DictReader(f)
+        ]
+    
+    with get_db() as conn:
+        conn.execute("BEGIN")
+        cursor = conn.executemany(INSERT_JOB_SQL, rows)
+        conn.commit()
+        invalidate_stats()
+    
+    return cursor.rowcount
 
 @app.post("/api/import-csv")
-def import_csv():
+async def import_csv():
     """Import jobs from existing CSV file"""
     csv_path = Path(__file__).parent / "recent_non_senior_jobs.csv"
     
     if not csv_path.exists():
         raise HTTPException(status_code=404, detail="CSV file not found")
     
-    df = pd.read_csv(csv_path)
-    added = 0
-    
-    with get_db() as conn:
-        for _, row in df.iterrows():
-            try:
-                date_posted = None
-                if pd.notna(row.get('date_posted')):
-                    try:
-                        date_posted = pd.to_datetime(row['date_posted']).strftime('%Y-%m-%d')
-                    except:
-                        date_posted = str(row['date_posted'])
-                
-                conn.execute("""
-                    INSERT OR IGNORE INTO jobs 
-                    (site, title, company, location, job_type, date_posted, job_url, 
-                     salary_min, salary_max, is_remote)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    row.get('site', ''),
-                    row.get('title', ''),
-                    row.get('company', ''),
-                    row.get('location', ''),
-                    row.get('job_type', ''),
-                    date_posted,
-                    row.get('job_url', ''),
-                    row.get('min_amount') if pd.notna(row.get('min_amount')) else None,
-                    row.get('max_amount') if pd.notna(row.get('max_amount')) else None,
-                    1 if row.get('is_remote') else 0
-                ))
-                added += 1
-            except:
-                pass
-        
-        conn.commit()
+    added = await asyncio.to_thread(import_csv_rows, csv_path)
     
     return {"message": f"Imported {added} jobs from CSV"}
 